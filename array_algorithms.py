@@ -11,8 +11,31 @@ Author: Victor Prefa
 Course: SIG720 Machine Learning - Deakin University
 """
 
+import numpy as np
+
 from typing import List, Tuple, Optional
 
+try:
+    from .string_operations import extract_digits
+except ImportError:
+    # Allow running this module standalone (python array_algorithms.py)
+    from string_operations import extract_digits
+
+# Compiled scan variants; worthwhile only past the dispatch threshold
+# below, and only when Numba is installed
+try:
+    try:
+        from . import array_algorithms_fast as _fast
+    except ImportError:
+        import array_algorithms_fast as _fast
+    HAS_NUMBA = True
+except ImportError:
+    _fast = None
+    HAS_NUMBA = False
+
+# Below this length the np.asarray conversion outweighs the compiled scan
+_FAST_PATH_THRESHOLD = 64
+
 
 def find_max_custom(digits: List[int]) -> Tuple[int, int]:
     """
@@ -38,15 +61,19 @@ def find_max_custom(digits: List[int]) -> Tuple[int, int]:
     """
     if not digits:
         raise ValueError("Cannot find maximum of empty list")
-    
-    maximum = digits[0]
-    max_index = 0
-    
-    for i in range(1, len(digits)):
-        if digits[i] > maximum:
-            maximum = digits[i]
-            max_index = i
-    
+
+    if HAS_NUMBA and len(digits) > _FAST_PATH_THRESHOLD:
+        maximum, max_index = _fast.find_max_custom(np.asarray(digits, dtype=np.int8))
+        return int(maximum), int(max_index)
+
+    # enumerate() rides the list-iterator fast path - no len() call or
+    # per-iteration subscript; re-comparing digits[0] is trivially cheap
+    maximum, max_index = digits[0], 0
+
+    for i, value in enumerate(digits):
+        if value > maximum:
+            maximum, max_index = value, i
+
     return maximum, max_index
 
 
@@ -72,77 +99,96 @@ def find_second_max_custom(digits: List[int]) -> Optional[int]:
     >>> find_second_max_custom([2, 2, 5, 1, 8, 7, 9, 1, 3])
     8
     """
-    if len(digits) < 2:
+    n = len(digits)
+    if n < 2:
         return None
-    
-    # Initialize first and second maximum
-    first_max = second_max = None
-    
+
+    if HAS_NUMBA and n > _FAST_PATH_THRESHOLD:
+        second_max = int(_fast.find_second_max_custom(np.asarray(digits, dtype=np.int8)))
+        return None if second_max == -1 else second_max
+
+    # Sentinel -1 is below any digit, so no per-iteration None checks:
+    # the loop body stays a flat compare-and-swap pattern
+    first_max = second_max = -1
+
     for num in digits:
-        if first_max is None or num > first_max:
+        if num > first_max:
             second_max = first_max
             first_max = num
-        elif num != first_max and (second_max is None or num > second_max):
+        elif num < first_max and num > second_max:
             second_max = num
-    
-    return second_max
+
+    return None if second_max == -1 else second_max
 
 
 def find_distinct_custom(digits: List[int]) -> List[int]:
     """
-    Find distinct elements preserving order WITHOUT using set().
-    
-    Time Complexity: O(n²) - for each element, check if seen before
+    Find distinct elements preserving order.
+
+    Time Complexity: O(n) - one membership test per element
     Space Complexity: O(n) - for storing distinct elements
-    
+
+    Decimal digits (the common case from student IDs) are tracked with
+    a 10-bit integer mask, so each element costs only a shift, an AND
+    and an OR. Other inputs fall back to a hash set.
+
     Parameters
     ----------
     digits : list
         List of integer digits
-        
+
     Returns
     -------
     list
         List of distinct digits in original order
-        
+
     Examples
     --------
     >>> find_distinct_custom([2, 2, 5, 1, 8, 7, 9, 1, 3])
     [2, 5, 1, 8, 7, 9, 3]
     """
     distinct = []
-    
-    for digit in digits:
-        # Check if digit already in distinct list
-        found = False
-        for d in distinct:
-            if d == digit:
-                found = True
-                break
-        
-        if not found:
-            distinct.append(digit)
-    
+
+    if all(isinstance(d, int) and 0 <= d <= 9 for d in digits):
+        # Digits 0-9: a bitmask replaces the membership scan entirely
+        seen = 0
+        for digit in digits:
+            bit = 1 << digit
+            if not (seen & bit):
+                seen |= bit
+                distinct.append(digit)
+    else:
+        # General case: hash set gives O(1) membership tests
+        seen_set = set()
+        for digit in digits:
+            if digit not in seen_set:
+                seen_set.add(digit)
+                distinct.append(digit)
+
     return distinct
 
 
 def count_smaller_numbers(digits: List[int]) -> List[int]:
     """
     For each digit, count how many numbers in the array are smaller.
-    
-    Time Complexity: O(n²) - nested comparison
-    Space Complexity: O(n) - for result array
-    
+
+    Time Complexity: O(n²) comparisons, vectorized in NumPy
+    Space Complexity: O(n²) - for the pairwise comparison matrix
+
+    The pairwise comparisons are performed as a single NumPy outer
+    comparison instead of nested Python loops, so the whole
+    compare-and-reduce runs in C rather than the interpreter.
+
     Parameters
     ----------
     digits : list
         List of integer digits
-        
+
     Returns
     -------
     list
         Count of smaller numbers for each position
-        
+
     Examples
     --------
     >>> count_smaller_numbers([1, 2, 3, 4, 5, 6])
@@ -150,43 +196,73 @@ def count_smaller_numbers(digits: List[int]) -> List[int]:
     >>> count_smaller_numbers([2, 2, 5, 1, 8, 7, 9, 1, 3])
     [2, 2, 5, 0, 7, 6, 8, 0, 4]
     """
-    smaller_counts = []
-    
-    for current_digit in digits:
-        count = 0
-        for other_digit in digits:
-            if other_digit < current_digit:
-                count += 1
-        smaller_counts.append(count)
-    
-    return smaller_counts
+    arr = np.asarray(digits, dtype=np.int8)
 
+    # counts[i] = number of j with arr[j] < arr[i], computed as one
+    # vectorized outer comparison plus a column-wise reduction
+    counts = np.less.outer(arr, arr).sum(axis=0)
 
-def analyze_student_id(student_id: str) -> dict:
+    return counts.tolist()
+
+
+def analyze_digits_fast(digits: List[int]) -> dict:
     """
-    Complete analysis of student ID digits.
-    
+    Analyze a digit sequence in a single pass via a 10-bin histogram.
+
+    Time Complexity: O(n + 10) - one pass plus fixed-size histogram scans
+    Space Complexity: O(n) - for the smaller-counts output
+
+    One traversal fills the histogram and records first-occurrence
+    order; maximum, second maximum, distinct digits and smaller-counts
+    all fall out of the histogram afterwards, replacing four separate
+    traversals (two of them O(n²)) with one.
+
     Parameters
     ----------
-    student_id : str
-        Student ID string
-        
+    digits : list
+        List of integer digits (0-9)
+
     Returns
     -------
     dict
-        Analysis results including max, second max, distinct, and smaller counts
+        Same keys as analyze_student_id(), minus 'digits'
+
+    Examples
+    --------
+    >>> analyze_digits_fast([2, 2, 5, 1, 8, 7, 9, 1, 3])['maximum']
+    9
     """
-    # Extract digits
-    digits = [int(char) for char in student_id if char.isdigit()]
-    
-    # Perform analysis
-    max_val, max_idx = find_max_custom(digits)
-    second_max = find_second_max_custom(digits)
-    distinct = find_distinct_custom(digits)
-    smaller_counts = count_smaller_numbers(digits)
-    
+    if not digits:
+        raise ValueError("Cannot find maximum of empty list")
+
+    # Single pass: histogram + first-seen order + index of first maximum
+    hist = [0] * 10
+    distinct = []
+    max_val = digits[0]
+    max_idx = 0
+
+    for i, digit in enumerate(digits):
+        if hist[digit] == 0:
+            distinct.append(digit)
+        hist[digit] += 1
+        if digit > max_val:
+            max_val = digit
+            max_idx = i
+
+    # Second maximum: next occupied bin below the maximum
+    second_max = None
+    for value in range(max_val - 1, -1, -1):
+        if hist[value] > 0:
+            second_max = value
+            break
+
+    # prefix[d] = how many digits are strictly smaller than d
+    prefix = [0] * 10
+    for value in range(1, 10):
+        prefix[value] = prefix[value - 1] + hist[value - 1]
+    smaller_counts = [prefix[digit] for digit in digits]
+
     return {
-        'digits': digits,
         'maximum': max_val,
         'max_index': max_idx,
         'second_maximum': second_max,
@@ -196,6 +272,31 @@ def analyze_student_id(student_id: str) -> dict:
     }
 
 
+def analyze_student_id(student_id: str) -> dict:
+    """
+    Complete analysis of student ID digits.
+
+    Parameters
+    ----------
+    student_id : str
+        Student ID string
+
+    Returns
+    -------
+    dict
+        Analysis results including max, second max, distinct, and smaller counts
+    """
+    # Extract digits (cached per input string in string_operations)
+    digits = extract_digits(student_id)
+
+    # All statistics come from one histogram pass; the individual
+    # find_*/count_* functions remain as standalone reference APIs
+    results = analyze_digits_fast(digits)
+    results = {'digits': digits, **results}
+
+    return results
+
+
 def demo():
     """Demonstrate array algorithms."""
     print("Array Algorithms Demo (No Built-in Functions)")
@@ -0,0 +1,77 @@
+"""
+Array Algorithms Fast Module
+
+Numba-compiled variants of the hot array scans, specialized to int8
+arrays (digits 0-9):
+- Find maximum and its index
+- Find second maximum
+
+Importing this module requires Numba; array_algorithms.py falls back
+to the pure-Python implementations when it is unavailable.
+
+Author: Victor Prefa
+Course: SIG720 Machine Learning - Deakin University
+"""
+
+import numpy as np
+from numba import njit, types
+from numba.types import int8, int64
+
+
+@njit(types.UniTuple(int64, 2)(int8[:]), cache=True, fastmath=True)
+def find_max_custom(digits):
+    """
+    Find maximum value and its index in an int8 array.
+
+    Compiled scalar loop: LLVM unrolls and vectorizes the scan, with
+    no per-element boxing.
+
+    Parameters
+    ----------
+    digits : np.ndarray
+        int8 array of digits (must be non-empty)
+
+    Returns
+    -------
+    tuple
+        (maximum_value, index_of_maximum)
+    """
+    maximum = digits[0]
+    max_index = 0
+
+    for i in range(1, len(digits)):
+        if digits[i] > maximum:
+            maximum = digits[i]
+            max_index = i
+
+    return maximum, max_index
+
+
+@njit(int64(int8[:]), cache=True, fastmath=True)
+def find_second_max_custom(digits):
+    """
+    Find second maximum value in an int8 array.
+
+    Parameters
+    ----------
+    digits : np.ndarray
+        int8 array of digits
+
+    Returns
+    -------
+    int
+        Second maximum value, or -1 if there is no second distinct
+        value (callers map -1 back to None at the Python boundary)
+    """
+    first_max = -1
+    second_max = -1
+
+    for i in range(len(digits)):
+        num = digits[i]
+        if num > first_max:
+            second_max = first_max
+            first_max = num
+        elif num < first_max and num > second_max:
+            second_max = num
+
+    return second_max
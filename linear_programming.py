@@ -11,41 +11,73 @@ Author: Victor Prefa
 Course: SIG720 Machine Learning - Deakin University
 """
 
+import math
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Tuple, List, Dict, Optional
 
+# Numba is optional: the kernel below runs as plain Python when it is
+# not installed, and gets JIT-compiled to machine code when it is
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _evaluate_constraints(A, B) -> bool:
+    """Evaluate all five problem constraints directly."""
+    constraint1 = A + 2*B <= 14  # Transportation constraint
+    constraint2 = B >= 3         # Minimum B units
+    constraint3 = A < 15         # Maximum A units
+    constraint4 = B < 15         # Maximum B units
+    constraint5 = A >= 0         # Non-negativity for A
+
+    return constraint1 and constraint2 and constraint3 and constraint4 and constraint5
+
+
+# The integer search domain is a fixed 16x16 grid, so feasibility of
+# every integer point is baked into one 256-bit mask at import time;
+# check_constraints then costs a single shift-and-test
+_FEASIBLE = 0
+for _A in range(16):
+    for _B in range(16):
+        if _evaluate_constraints(_A, _B):
+            _FEASIBLE |= 1 << (_A * 16 + _B)
+del _A, _B
+
 
 def check_constraints(A: int, B: int) -> bool:
     """
     Check if point (A, B) satisfies all problem constraints.
-    
+
     Constraints:
         1. A + 2B <= 14 (Transportation constraint)
         2. B >= 3 (Minimum B units)
         3. A < 15 (Maximum A units)
         4. B < 15 (Maximum B units)
         5. A >= 0 (Non-negativity for A)
-    
+
+    Integer points on the 16x16 search grid are answered from the
+    precomputed bitmask; anything else (floats, out-of-grid values)
+    falls back to evaluating the constraints directly.
+
     Parameters
     ----------
     A : int
         Units of Product A
     B : int
         Units of Product B
-        
+
     Returns
     -------
     bool
         True if all constraints satisfied, False otherwise
     """
-    constraint1 = A + 2*B <= 14  # Transportation constraint
-    constraint2 = B >= 3         # Minimum B units
-    constraint3 = A < 15         # Maximum A units
-    constraint4 = B < 15         # Maximum B units
-    constraint5 = A >= 0         # Non-negativity for A
-    
-    return constraint1 and constraint2 and constraint3 and constraint4 and constraint5
+    if isinstance(A, int) and isinstance(B, int) and 0 <= A < 16 and 0 <= B < 16:
+        return bool(_FEASIBLE >> (A * 16 + B) & 1)
+
+    return _evaluate_constraints(A, B)
 
 
 def calculate_objective(A: int, B: int) -> int:
@@ -67,6 +99,106 @@ def calculate_objective(A: int, B: int) -> int:
     return 3 * A + 4 * B
 
 
+def _solve_kernel_scalar() -> Tuple[int, int, int, np.ndarray, int]:
+    """
+    Enumerate the integer search grid as a pure numeric kernel.
+
+    The constraint checks and objective are inlined as plain scalar
+    arithmetic so that Numba (when available) can compile the whole
+    search to machine code without Python frame overhead per candidate.
+
+    Returns
+    -------
+    tuple
+        (optimal_A, optimal_B, max_revenue, feasible_array, num_feasible)
+        where feasible_array holds (A, B, revenue) rows and only the
+        first num_feasible rows are valid
+    """
+    # At most 15 * 12 candidate points
+    feasible = np.empty((180, 3), dtype=np.int32)
+    count = 0
+
+    best_A = 0
+    best_B = 0
+    best_val = -1
+
+    for A in range(0, 15):
+        for B in range(3, 15):
+            # Inlined check_constraints(A, B)
+            if A + 2 * B <= 14 and B >= 3 and A < 15 and B < 15 and A >= 0:
+                # Inlined calculate_objective(A, B)
+                obj_val = 3 * A + 4 * B
+
+                feasible[count, 0] = A
+                feasible[count, 1] = B
+                feasible[count, 2] = obj_val
+                count += 1
+
+                if obj_val > best_val:
+                    best_val = obj_val
+                    best_A = A
+                    best_B = B
+
+    return best_A, best_B, best_val, feasible, count
+
+
+def _solve_kernel_numpy() -> Tuple[int, int, int, np.ndarray, int]:
+    """
+    Vectorized twin of _solve_kernel_scalar using a NumPy meshgrid.
+
+    Evaluates the transportation constraint and the objective over the
+    whole candidate grid in a handful of C-level array operations,
+    replacing 180 interpreter iterations. The grid bounds themselves
+    enforce B >= 3, A < 15, B < 15 and A >= 0.
+
+    Returns
+    -------
+    tuple
+        Same (optimal_A, optimal_B, max_revenue, feasible_array,
+        num_feasible) layout as _solve_kernel_scalar
+    """
+    A, B = np.meshgrid(np.arange(15), np.arange(3, 15), indexing='ij')
+    mask = A + 2 * B <= 14
+
+    A_feas = A[mask]
+    B_feas = B[mask]
+    obj = 3 * A_feas + 4 * B_feas
+
+    best = int(obj.argmax())
+    feasible = np.stack([A_feas, B_feas, obj], axis=1).astype(np.int32)
+
+    return int(A_feas[best]), int(B_feas[best]), int(obj[best]), feasible, len(obj)
+
+
+if numba is not None:
+    # Scalar loops compile best under njit; the vectorized version is
+    # the fast path when only NumPy is available
+    _solve_kernel = numba.njit(cache=True)(_solve_kernel_scalar)
+else:
+    _solve_kernel = _solve_kernel_numpy
+
+
+def iter_feasible_points():
+    """
+    Lazily yield feasible (A, B, revenue) tuples over the search grid.
+
+    Nothing is materialized up front: each point is produced on demand,
+    so peak memory stays constant no matter how wide the variable
+    bounds grow. Single-pass consumers that do not need len() or the
+    solver's preallocated array should prefer this over
+    brute_force_solve()['feasible_points'].
+
+    Yields
+    ------
+    tuple
+        (A, B, revenue) for each feasible integer point
+    """
+    for A in range(0, 15):
+        for B in range(3, 15):
+            if check_constraints(A, B):
+                yield A, B, calculate_objective(A, B)
+
+
 def brute_force_solve(verbose: bool = True) -> Dict:
     """
     Solve the LP problem using brute-force enumeration of integer solutions.
@@ -87,65 +219,178 @@ def brute_force_solve(verbose: bool = True) -> Dict:
     Returns
     -------
     dict
-        Solution containing optimal point, value, and all feasible points
+        Solution containing optimal point, value, and all feasible
+        points as an (n_feasible, 3) int array of [A, B, Z] rows
     """
-    # Search ranges based on constraints
-    A_range = range(0, 15)    # A values (A < 15, A >= 0)
-    B_range = range(3, 15)    # B values (B >= 3, B < 15)
-    
-    # Initialize tracking variables
-    max_val = float('-inf')
-    max_sol = (0, 0)
-    feasible_points = []
-    
+    # Run the numeric search kernel (JIT-compiled when Numba is present)
+    best_A, best_B, best_val, feasible, count = _solve_kernel()
+
+    max_sol = (int(best_A), int(best_B))
+    max_val = int(best_val)
+    # Zero-copy view of the kernel's buffer; consumers like
+    # plot_feasible_region slice columns directly
+    feasible_points = feasible[:count]
+
     if verbose:
-        print("Linear Programming Optimization")
-        print("=" * 50)
-        print("Problem: Maximize Z = 3A + 4B")
-        print("Constraints: A + 2B ≤ 14, B ≥ 3, A < 15, B < 15, A ≥ 0")
-        print("\nSearching for optimal solution...")
-        print("-" * 50)
-        print(f"{'Point (A, B)':<15} {'Feasible':<12} {'Revenue ($)':<12}")
-        print("-" * 50)
+        # Buffer everything and write once: per-point print() calls
+        # (stdout locking + flushing) would dwarf the search itself
+        lines = [
+            "Linear Programming Optimization",
+            "=" * 50,
+            "Problem: Maximize Z = 3A + 4B",
+            "Constraints: A + 2B ≤ 14, B ≥ 3, A < 15, B < 15, A ≥ 0",
+            "\nSearching for optimal solution...",
+            "-" * 50,
+            f"{'Point (A, B)':<15} {'Feasible':<12} {'Revenue ($)':<12}",
+            "-" * 50,
+        ]
+        for A, B, obj_val in feasible_points:
+            lines.append(f"({A:2d}, {B:2d}){'':<8} {'✓':<12} ${obj_val:<11}")
+        lines.extend([
+            "-" * 50,
+            f"\n{'='*50}",
+            "OPTIMAL SOLUTION FOUND",
+            f"{'='*50}",
+            f"Product A units: {max_sol[0]}",
+            f"Product B units: {max_sol[1]}",
+            f"Maximum Revenue: ${max_val}",
+            f"Feasible Solutions: {len(feasible_points)}",
+        ])
+        sys.stdout.write('\n'.join(lines) + '\n')
     
-    # Enumerate all integer combinations
-    for A in A_range:
-        for B in B_range:
+    return {
+        'optimal_A': max_sol[0],
+        'optimal_B': max_sol[1],
+        'max_revenue': max_val,
+        'feasible_points': feasible_points,
+        'num_feasible': len(feasible_points)
+    }
+
+
+def vertex_solve(verbose: bool = False) -> Dict:
+    """
+    Solve the LP problem by enumerating vertices of the feasible region.
+
+    By LP theory the optimum of a linear objective over a polytope lies
+    at a vertex, so it suffices to intersect the constraint boundary
+    lines pairwise and evaluate Z = 3A + 4B at each feasible
+    intersection - O(1) work regardless of how wide the variable bounds
+    are, where brute force scales with the grid size. The integer
+    optimum is then recovered by checking the integer neighbours
+    (floor/ceil of each coordinate) of the best LP vertex.
+
+    Parameters
+    ----------
+    verbose : bool
+        Whether to print the vertices considered
+
+    Returns
+    -------
+    dict
+        Solution containing 'optimal_A', 'optimal_B', 'max_revenue',
+        and the continuous optimum under 'lp_vertex'
+    """
+    # Constraint boundaries as lines a*A + b*B = c
+    # (A < 15 and B < 15 over integers close to A <= 14, B <= 14)
+    lines = [
+        (1, 2, 14),   # A + 2B = 14 (transportation)
+        (0, 1, 3),    # B = 3 (minimum B)
+        (1, 0, 0),    # A = 0 (non-negativity)
+        (1, 0, 14),   # A = 14 (maximum A)
+        (0, 1, 14),   # B = 14 (maximum B)
+    ]
+
+    # Pairwise intersections, keeping only feasible vertices
+    best_vertex = None
+    best_vertex_val = float('-inf')
+    for i in range(len(lines)):
+        for j in range(i + 1, len(lines)):
+            a1, b1, c1 = lines[i]
+            a2, b2, c2 = lines[j]
+            det = a1 * b2 - a2 * b1
+            if det == 0:
+                continue  # Parallel lines, no vertex
+
+            A = (c1 * b2 - c2 * b1) / det
+            B = (a1 * c2 - a2 * c1) / det
+            if not check_constraints(A, B):
+                continue
+
+            obj_val = calculate_objective(A, B)
+            if verbose:
+                print(f"Vertex ({A:.1f}, {B:.1f}): Z = {obj_val}")
+            if obj_val > best_vertex_val:
+                best_vertex_val = obj_val
+                best_vertex = (A, B)
+
+    # Integer optimum: test the integer neighbours of the LP vertex
+    A_star, B_star = best_vertex
+    max_sol = (0, 0)
+    max_val = float('-inf')
+    for A in (math.floor(A_star), math.ceil(A_star)):
+        for B in (math.floor(B_star), math.ceil(B_star)):
             if check_constraints(A, B):
                 obj_val = calculate_objective(A, B)
-                feasible_points.append((A, B, obj_val))
-                
-                if verbose:
-                    print(f"({A:2d}, {B:2d}){'':<8} {'✓':<12} ${obj_val:<11}")
-                
-                # Update maximum if better solution found
                 if obj_val > max_val:
                     max_val = obj_val
                     max_sol = (A, B)
-    
+
     if verbose:
-        print("-" * 50)
-        print(f"\n{'='*50}")
-        print("OPTIMAL SOLUTION FOUND")
-        print(f"{'='*50}")
-        print(f"Product A units: {max_sol[0]}")
-        print(f"Product B units: {max_sol[1]}")
-        print(f"Maximum Revenue: ${max_val}")
-        print(f"Feasible Solutions: {len(feasible_points)}")
-    
+        print(f"LP vertex: ({A_star:.1f}, {B_star:.1f}) with Z = {best_vertex_val}")
+        print(f"Integer optimum: {max_sol} with revenue ${max_val}")
+
     return {
         'optimal_A': max_sol[0],
         'optimal_B': max_sol[1],
         'max_revenue': max_val,
-        'feasible_points': feasible_points,
-        'num_feasible': len(feasible_points)
+        'lp_vertex': best_vertex
     }
 
 
+def _check_constraints_bits(A: int, B: int) -> Tuple[int, int]:
+    """
+    Compute constraint satisfaction and bindingness as bitmasks.
+
+    Bit layout (LSB first): transportation, min_B, max_A, max_B,
+    non-negativity - matching the key order of verify_constraints().
+    Pure integer arithmetic, no string formatting, so it is cheap
+    enough for what-if loops.
+
+    Parameters
+    ----------
+    A : int
+        Units of Product A
+    B : int
+        Units of Product B
+
+    Returns
+    -------
+    tuple
+        (satisfied_mask, binding_mask)
+    """
+    satisfied = (
+        (A + 2 * B <= 14)
+        | (B >= 3) << 1
+        | (A < 15) << 2
+        | (B < 15) << 3
+        | (A >= 0) << 4
+    )
+    binding = (
+        (A + 2 * B == 14)
+        | (B == 3) << 1
+        | (A == 0) << 4
+    )
+    return satisfied, binding
+
+
 def verify_constraints(A: int, B: int, verbose: bool = True) -> Dict:
     """
     Verify and display constraint satisfaction for a solution.
-    
+
+    With verbose=False only the satisfaction/bindingness bitmasks from
+    _check_constraints_bits() are returned, skipping the per-call
+    construction of the formatted explanation dict.
+
     Parameters
     ----------
     A : int
@@ -154,12 +399,20 @@ def verify_constraints(A: int, B: int, verbose: bool = True) -> Dict:
         Units of Product B
     verbose : bool
         Whether to print results
-        
+
     Returns
     -------
     dict
-        Constraint satisfaction details
+        Constraint satisfaction details when verbose, otherwise
+        {'satisfied_mask': int, 'binding_mask': int}
     """
+    if not verbose:
+        satisfied_mask, binding_mask = _check_constraints_bits(A, B)
+        return {
+            'satisfied_mask': satisfied_mask,
+            'binding_mask': binding_mask
+        }
+
     constraints = {
         'transportation': {
             'expression': f'{A} + 2({B}) = {A + 2*B}',
@@ -215,6 +468,10 @@ def plot_feasible_region(solution: Dict, save_path: Optional[str] = None):
     save_path : str, optional
         Path to save the figure
     """
+    # Imported lazily: loading Matplotlib costs hundreds of ms and tens
+    # of MB, which solver-only callers should not pay
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(10, 8))
     
     # Create plotting range
@@ -234,10 +491,10 @@ def plot_feasible_region(solution: Dict, save_path: Optional[str] = None):
     # Constraint 4: B < 15
     ax.axhline(y=15, color='orange', linestyle='--', label='B < 15', linewidth=2)
     
-    # Fill feasible region
-    feasible_A = [p[0] for p in solution['feasible_points']]
-    feasible_B = [p[1] for p in solution['feasible_points']]
-    ax.scatter(feasible_A, feasible_B, c='purple', s=50, alpha=0.6, 
+    # Fill feasible region - column views straight into the solver's
+    # (n, 3) array, no per-point list building
+    pts = np.asarray(solution['feasible_points'])
+    ax.scatter(pts[:, 0], pts[:, 1], c='purple', s=50, alpha=0.6,
                label=f'Feasible Points ({solution["num_feasible"]})')
     
     # Plot optimal point
@@ -245,10 +502,11 @@ def plot_feasible_region(solution: Dict, save_path: Optional[str] = None):
                c='red', s=200, marker='*', zorder=5,
                label=f'Optimal: ({solution["optimal_A"]}, {solution["optimal_B"]})')
     
-    # Add iso-profit lines
-    for z in [20, 30, 36]:
-        B_iso = (z - 3*A_plot) / 4
-        ax.plot(A_plot, B_iso, '--', alpha=0.3, label=f'Z = {z}' if z == 36 else '')
+    # Add iso-profit lines, computed in one broadcast expression
+    Z_levels = np.array([20, 30, 36])
+    B_iso = (Z_levels[:, None] - 3 * A_plot[None, :]) / 4
+    for z, B_row in zip(Z_levels, B_iso):
+        ax.plot(A_plot, B_row, '--', alpha=0.3, label=f'Z = {z}' if z == 36 else '')
     
     ax.set_xlabel('Product A (units)', fontsize=12)
     ax.set_ylabel('Product B (units)', fontsize=12)
@@ -268,15 +526,24 @@ def plot_feasible_region(solution: Dict, save_path: Optional[str] = None):
     plt.show()
 
 
-def sensitivity_analysis(solution: Dict) -> Dict:
+def sensitivity_analysis(solution: Dict, verify: bool = False) -> Dict:
     """
     Perform basic sensitivity analysis on the optimal solution.
-    
+
+    Shadow prices come from the binding constraints at the optimum
+    rather than re-enumerating the grid: at (8, 3) the binding
+    constraints are A + 2B ≤ 14 and B ≥ 3, so relaxing transportation
+    by Δ lets A grow by Δ (B stays at 3), raising revenue by 3Δ, while
+    raising the B minimum by 1 forces B up and A down 2 for a net -2.
+
     Parameters
     ----------
     solution : dict
         Solution from brute_force_solve()
-        
+    verify : bool
+        Cross-check the closed-form what-if against a brute-force
+        re-enumeration (kept for tests; not needed in normal use)
+
     Returns
     -------
     dict
@@ -284,36 +551,50 @@ def sensitivity_analysis(solution: Dict) -> Dict:
     """
     A_opt = solution['optimal_A']
     B_opt = solution['optimal_B']
-    
+
     print("\nSensitivity Analysis")
     print("=" * 50)
-    
+
     # Slack analysis
     transport_slack = 14 - (A_opt + 2*B_opt)
     min_B_slack = B_opt - 3
-    
+
     print(f"\nSlack Variables:")
     print(f"  Transportation (A + 2B ≤ 14): {transport_slack} units slack")
     print(f"  Minimum B (B ≥ 3): {min_B_slack} units slack")
-    
-    # What-if: increase transportation capacity
+
+    # Shadow prices at the optimal vertex (closed form, no re-solve)
+    shadow_price_transport = 3   # each extra capacity unit buys one more A
+    shadow_price_min_B = -2      # each forced B swaps 4 in for 2 A out (6 revenue)
+
+    # What-if: transportation capacity 14 -> 16 means two extra A units
+    capacity_delta = 2
+    new_sol = (A_opt + capacity_delta, B_opt)
+    new_max = solution['max_revenue'] + shadow_price_transport * capacity_delta
+
+    if verify:
+        # Brute-force cross-check of the closed-form prediction
+        check_max = 0
+        check_sol = (0, 0)
+        for A in range(0, 15):
+            for B in range(3, 15):
+                if A + 2*B <= 16 and A >= 0:  # Modified constraint
+                    obj = 3*A + 4*B
+                    if obj > check_max:
+                        check_max = obj
+                        check_sol = (A, B)
+        assert (check_sol, check_max) == (new_sol, new_max), \
+            f"Closed-form what-if {new_sol, new_max} != enumerated {check_sol, check_max}"
+
     print(f"\nWhat-if: Transportation capacity increases to 16?")
-    new_max = 0
-    new_sol = (0, 0)
-    for A in range(0, 15):
-        for B in range(3, 15):
-            if A + 2*B <= 16 and A >= 0:  # Modified constraint
-                obj = 3*A + 4*B
-                if obj > new_max:
-                    new_max = obj
-                    new_sol = (A, B)
-    
     print(f"  New optimal: ({new_sol[0]}, {new_sol[1]}) with revenue ${new_max}")
     print(f"  Revenue increase: ${new_max - solution['max_revenue']}")
-    
+
     return {
         'transport_slack': transport_slack,
         'min_B_slack': min_B_slack,
+        'shadow_price_transport': shadow_price_transport,
+        'shadow_price_min_B': shadow_price_min_B,
         'shadow_price_estimate': (new_max - solution['max_revenue']) / 2
     }
 
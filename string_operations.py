@@ -10,7 +10,9 @@ Author: Victor Prefa
 Course: SIG720 Machine Learning - Deakin University
 """
 
-from typing import List, Union
+import functools
+
+from typing import List, Tuple, Union
 
 
 def reverse_student_id(student_id: str) -> List[str]:
@@ -40,13 +42,16 @@ def reverse_student_id(student_id: str) -> List[str]:
     >>> reverse_student_id("s225187913")
     ['3', '1', '9', '7', '8', '1', '5', '2', '2', 's']
     """
-    # Input validation
-    if not isinstance(student_id, str) or not student_id.lower().startswith('s'):
+    # Input validation - first-char check avoids lowercasing the
+    # whole string just to test its prefix
+    if not isinstance(student_id, str) or student_id[:1] not in ('s', 'S'):
         raise ValueError("Student ID must be a string starting with 's'")
-    
-    # Reverse using Python slicing - O(n) operation
-    # This leverages Python's optimized string operations
-    return list(student_id[::-1])
+
+    # Build the list once and reverse it in place (pointer swaps),
+    # skipping the intermediate reversed string a slice would allocate
+    result = list(student_id)
+    result.reverse()
+    return result
 
 
 def reverse_student_id_from_index(student_id: str, start_index: int) -> str:
@@ -91,37 +96,68 @@ def reverse_student_id_from_index(student_id: str, start_index: int) -> str:
     if not isinstance(start_index, int):
         raise TypeError("Index must be an integer")
     
-    if start_index < 0 or start_index >= len(student_id):
-        raise IndexError(f"Index {start_index} out of range for string length {len(student_id)}")
+    n = len(student_id)
+    if start_index < 0 or start_index >= n:
+        raise IndexError(f"Index {start_index} out of range for string length {n}")
     
-    # Split and reverse using slicing
-    # This is the most Pythonic and efficient approach
-    unchanged_part = student_id[:start_index]
-    part_to_reverse = student_id[start_index:]
-    
-    return unchanged_part + part_to_reverse[::-1]
+    if not student_id.isascii():
+        # Rare non-ASCII IDs keep the slice-based path
+        return student_id[:start_index] + student_id[start_index:][::-1]
+
+    # One buffer, swapped in place over the suffix - no intermediate
+    # slice strings or concatenation
+    buffer = bytearray(student_id, 'ascii')
+    lo, hi = start_index, n - 1
+    while lo < hi:
+        buffer[lo], buffer[hi] = buffer[hi], buffer[lo]
+        lo += 1
+        hi -= 1
+
+    return buffer.decode('ascii')
+
+
+# Deletion table mapping every non-digit byte out of a bytes object,
+# built once at import so extraction is a single C-level translate call
+_NON_DIGITS = bytes(i for i in range(256) if not (48 <= i <= 57))
+
+
+@functools.lru_cache(maxsize=128)
+def _extract_digits_cached(student_id: str) -> Tuple[int, ...]:
+    """Cached digit extraction; returns a tuple so results are hashable."""
+    if student_id.isascii():
+        # translate() strips non-digits in C; the remaining byte values
+        # are ord('0') + d, so subtracting 48 avoids int(char) parsing
+        digit_bytes = bytes(student_id, 'ascii').translate(None, delete=_NON_DIGITS)
+        return tuple(b - 48 for b in digit_bytes)
+
+    # Range comparison avoids the Unicode category lookup of isdigit()
+    return tuple(int(char) for char in student_id if '0' <= char <= '9')
 
 
 def extract_digits(student_id: str) -> List[int]:
     """
     Extract integer digits from a student ID.
-    
+
+    Repeated calls with the same ID are served from an LRU cache, so
+    combined workflows (e.g. reversal plus digit analysis) only scan
+    the string once.
+
     Parameters
     ----------
     student_id : str
         Student ID string (e.g., "s225187913")
-        
+
     Returns
     -------
     list
         List of integer digits
-        
+
     Examples
     --------
     >>> extract_digits("s225187913")
     [2, 2, 5, 1, 8, 7, 9, 1, 3]
     """
-    return [int(char) for char in student_id if char.isdigit()]
+    return list(_extract_digits_cached(student_id))
 
 
 def demo():